@@ -0,0 +1,73 @@
+"""
+Local stand-ins used by the benchmarks: a SOCKS5 proxy (tiny_proxy)
+and a minimal keep-alive HTTP/1.1 server that answers every request
+with a fixed-size body. Both run in daemon child processes so they do
+not compete with the measured client for the GIL.
+"""
+
+from __future__ import annotations
+
+import socket
+import socketserver
+from multiprocessing import Process
+
+import anyio
+from tiny_proxy import Socks5ProxyHandler
+
+from tests.utils import wait_until_connectable
+
+
+async def _serve_socks5(host: str, port: int) -> None:
+    handler = Socks5ProxyHandler()
+    listener = await anyio.create_tcp_listener(local_host=host, local_port=port)
+    async with listener:
+        await listener.serve(handler.handle)
+
+
+def _run_socks5(host: str, port: int) -> None:
+    anyio.run(_serve_socks5, host, port)
+
+
+def start_socks5_proxy(host: str, port: int) -> None:
+    Process(target=_run_socks5, args=(host, port), daemon=True).start()
+    wait_until_connectable(host=host, port=port)
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    body: memoryview
+    chunk_size = 256 * 1024
+
+    def handle(self) -> None:
+        header = (
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Length: " + str(len(self.body)).encode() + b"\r\n\r\n"
+        )
+        buf = b""
+        while True:
+            data = self.request.recv(65536)
+            if not data:
+                return
+            buf += data
+            # the benchmarks only send bodiless requests
+            while b"\r\n\r\n" in buf:
+                _, buf = buf.split(b"\r\n\r\n", 1)
+                self.request.sendall(header + self.body[: self.chunk_size])
+                for i in range(self.chunk_size, len(self.body), self.chunk_size):
+                    self.request.sendall(self.body[i : i + self.chunk_size])
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def _run_http(host: str, port: int, body_size: int) -> None:
+    handler = type("Handler", (_Handler,), {"body": memoryview(b"x" * body_size)})
+    server = _Server((host, port), handler)
+    server.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    server.serve_forever()
+
+
+def start_http_server(host: str, port: int, body_size: int) -> None:
+    Process(target=_run_http, args=(host, port, body_size), daemon=True).start()
+    wait_until_connectable(host=host, port=port)
@@ -0,0 +1,82 @@
+"""
+Request rate of AsyncProxyTransport through a local SOCKS5 proxy,
+on the default asyncio loop and on uvloop (when installed), with and
+without extra socket options on the tunnel socket.
+
+Usage: python -m benchmarks.bench_async_transport [REQUESTS] [CONCURRENCY]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import sys
+import time
+from collections.abc import Callable
+
+import httpx
+
+from benchmarks._servers import start_http_server, start_socks5_proxy
+from httpx_socks import AsyncProxyTransport
+
+PROXY_URL = "socks5://127.0.0.1:7790"
+TARGET_URL = "http://127.0.0.1:8891/"
+
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    (socket.SOL_SOCKET, socket.SO_RCVBUF, 1024 * 1024),
+    (socket.SOL_SOCKET, socket.SO_SNDBUF, 1024 * 1024),
+]
+
+
+async def run(requests: int, concurrency: int, **kwargs: object) -> float:
+    transport = AsyncProxyTransport.from_url(PROXY_URL, **kwargs)
+    async with httpx.AsyncClient(transport=transport) as client:
+        queue = iter(range(requests))
+
+        async def worker() -> None:
+            for _ in queue:
+                res = await client.get(TARGET_URL)
+                res.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return time.perf_counter() - start
+
+
+def loop_factories() -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    factories = {"asyncio": asyncio.new_event_loop}
+    try:
+        import uvloop  # noqa: PLC0415
+    except ImportError:
+        print("uvloop is not installed, skipping")
+    else:
+        factories["uvloop"] = uvloop.new_event_loop
+    return factories
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    start_socks5_proxy("127.0.0.1", 7790)
+    start_http_server("127.0.0.1", 8891, body_size=1024)
+
+    for loop_name, factory in loop_factories().items():
+        for opts_name, opts in (("default", None), ("socket_options", SOCKET_OPTIONS)):
+            loop = factory()
+            try:
+                elapsed = loop.run_until_complete(
+                    run(requests, concurrency, socket_options=opts)
+                )
+            finally:
+                loop.close()
+            print(
+                f"{loop_name:8s} {opts_name:15s} "
+                f"{requests / elapsed:8.0f} req/s ({elapsed:.2f}s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
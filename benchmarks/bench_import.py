@@ -0,0 +1,43 @@
+"""
+Import time of httpx_socks and of each transport.
+
+Every measurement runs in a fresh interpreter, so nothing is cached
+between runs.
+
+Usage: python -m benchmarks.bench_import [REPEAT]
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+import time
+
+CASES = {
+    "import httpx_socks": "import httpx_socks",
+    "AsyncProxyTransport": "from httpx_socks import AsyncProxyTransport",
+    "SyncProxyTransport": "from httpx_socks import SyncProxyTransport",
+    "both transports": (
+        "from httpx_socks import AsyncProxyTransport, SyncProxyTransport"
+    ),
+}
+
+
+def _measure(code: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    baseline = statistics.median(_measure("pass") for _ in range(repeat))
+
+    for name, code in CASES.items():
+        elapsed = statistics.median(_measure(code) for _ in range(repeat))
+        print(f"{name:22s} {(elapsed - baseline) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Checkout cost of idle SyncStream objects.
+
+On every pool checkout httpcore asks each idle HTTP/1.1 connection
+whether it has expired, which in turn calls
+``stream.get_extra_info("is_readable")``. This script measures the cost
+of one such sweep over N idle streams for httpcore's SyncStream, for
+the previous httpx_socks SyncStream (isinstance chain plus
+``is_socket_readable`` on every call) and for the current one.
+
+Usage: python -m benchmarks.bench_sync_stream [N]
+"""
+
+from __future__ import annotations
+
+import resource
+import socket
+import ssl
+import sys
+import timeit
+import typing
+
+from httpcore._backends.sync import SyncStream as CoreSyncStream
+from httpcore._utils import is_socket_readable
+from python_socks.sync.v2._ssl_transport import SSLTransport
+
+from httpx_socks._sync_stream import SyncStream
+
+
+class LegacySyncStream(CoreSyncStream):
+    """httpx_socks SyncStream.get_extra_info before the lookup table"""
+
+    def get_extra_info(self, info: str) -> typing.Any:  # noqa: C901, PLR0911
+        if info == "ssl_object":
+            if isinstance(self._sock, ssl.SSLSocket):
+                return self._sock._sslobj  # type: ignore[attr-defined]  # noqa: SLF001
+            if isinstance(self._sock, SSLTransport):
+                return self._sock.sslobj
+            return None
+        if info == "client_addr":
+            if isinstance(self._sock, SSLTransport):
+                return self._sock.socket.getsockname()
+            return self._sock.getsockname()
+        if info == "server_addr":
+            if isinstance(self._sock, SSLTransport):
+                return self._sock.socket.getpeername()
+            return self._sock.getpeername()
+        if info == "socket":
+            return self._sock
+        if info == "is_readable":
+            if isinstance(self._sock, SSLTransport):
+                return is_socket_readable(self._sock.socket)
+            return is_socket_readable(self._sock)
+        return None
+
+
+def _raise_nofile_limit(n: int) -> None:
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = min(hard, max(soft, n + 256))
+    resource.setrlimit(resource.RLIMIT_NOFILE, (wanted, hard))
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    _raise_nofile_limit(n)
+
+    # both ends of a socketpair serve as idle connections
+    pairs = [socket.socketpair() for _ in range(n // 2)]
+    socks = [s for pair in pairs for s in pair]
+    try:
+        for name, cls in (
+            ("httpcore", CoreSyncStream),
+            ("previous", LegacySyncStream),
+            ("current", SyncStream),
+        ):
+            streams = [cls(sock) for sock in socks]
+
+            def sweep(streams: list[CoreSyncStream] = streams) -> None:
+                for stream in streams:
+                    stream.get_extra_info("is_readable")
+
+            best = min(timeit.repeat(sweep, number=10, repeat=5)) / 10
+            print(
+                f"{name:12s} {n} idle streams: {best * 1e3:8.2f} ms/sweep, "
+                f"{best / n * 1e9:8.1f} ns/stream"
+            )
+    finally:
+        for sock in socks:
+            sock.close()
+
+
+if __name__ == "__main__":
+    main()
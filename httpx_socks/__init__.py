@@ -1,6 +1,9 @@
 __title__ = "httpx-socks"
 __version__ = "0.13.1"
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from python_socks import (
     ProxyConnectionError,
     ProxyError,
@@ -8,8 +11,31 @@ from python_socks import (
     ProxyType,
 )
 
-from ._async_transport import AsyncProxyTransport
-from ._sync_transport import SyncProxyTransport
+if TYPE_CHECKING:
+    from ._async_transport import AsyncProxyTransport
+    from ._sync_transport import SyncProxyTransport
+
+# The transports pull in httpx/httpcore and the python-socks backends,
+# so they are only imported on first access (PEP 562)
+_lazy_attrs = {
+    "AsyncProxyTransport": "._async_transport",
+    "SyncProxyTransport": "._sync_transport",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _lazy_attrs.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = (
     "AsyncProxyTransport",
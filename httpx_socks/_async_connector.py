@@ -0,0 +1,242 @@
+# ruff: noqa: PLC0415
+from __future__ import annotations
+
+import asyncio
+import socket
+import ssl
+from collections.abc import Iterable
+from typing import Any
+
+import anyio
+import sniffio
+from httpcore import AsyncNetworkStream
+from httpcore._backends.base import SOCKET_OPTION
+from python_socks import (
+    ProxyConnectionError,
+    ProxyError,
+    ProxyTimeoutError,
+    ProxyType,
+)
+from python_socks._connectors.factory_async import create_connector
+from python_socks._protocols.errors import ReplyError
+
+from ._utils import set_socket_options
+
+DEFAULT_TIMEOUT = 60
+DEFAULT_RECEIVE_SIZE = 65536
+
+
+class _SocksStream:
+    """
+    Adapts an httpcore network stream to the stream interface
+    expected by python-socks connectors (both the 2.x and 3.x method names)
+    """
+
+    def __init__(self, stream: AsyncNetworkStream) -> None:
+        self._stream = stream
+
+    async def write(self, data: bytes) -> None:
+        await self._stream.write(data)
+
+    async def read(self, max_bytes: int = DEFAULT_RECEIVE_SIZE) -> bytes:
+        return await self._stream.read(max_bytes)
+
+    async def read_exactly(self, n: int) -> bytes:
+        data = bytearray()
+        while len(data) < n:
+            packet = await self._stream.read(n - len(data))
+            if not packet:
+                raise ProxyError("Connection closed unexpectedly")
+            data.extend(packet)
+        return bytes(data)
+
+    write_all = write
+    read_exact = read_exactly
+
+
+class AsyncProxyConnector:
+    """
+    Establishes a tunnel through the proxy on top of httpcore network streams.
+
+    The TCP socket to the proxy is created here, so socket options are
+    applied before connecting, then the proxy handshake is driven by
+    python-socks connectors.
+    """
+
+    def __init__(
+        self,
+        *,
+        proxy_type: ProxyType,
+        proxy_host: str,
+        proxy_port: int,
+        username: str | None = None,
+        password: str | None = None,
+        rdns: bool | None = None,
+        proxy_ssl: ssl.SSLContext | None = None,
+        socket_options: Iterable[SOCKET_OPTION] | None = None,
+    ) -> None:
+        self._proxy_type = proxy_type
+        self._proxy_host = proxy_host
+        self._proxy_port = proxy_port
+        self._username = username
+        self._password = password
+        self._rdns = rdns
+        self._proxy_ssl = proxy_ssl
+        self._socket_options = socket_options
+
+    async def connect(
+        self,
+        dest_host: str,
+        dest_port: int,
+        dest_ssl: ssl.SSLContext | None = None,
+        timeout: float | None = None,
+    ) -> AsyncNetworkStream:
+        if timeout is None:
+            timeout = DEFAULT_TIMEOUT
+
+        try:
+            with anyio.fail_after(timeout):
+                return await self._connect(
+                    dest_host=dest_host,
+                    dest_port=dest_port,
+                    dest_ssl=dest_ssl,
+                )
+        except TimeoutError as e:
+            raise ProxyTimeoutError(f"Proxy connection timed out: {timeout}") from e
+
+    async def _connect(
+        self,
+        dest_host: str,
+        dest_port: int,
+        dest_ssl: ssl.SSLContext | None,
+    ) -> AsyncNetworkStream:
+        stream = await self._connect_tcp()
+
+        try:
+            if self._proxy_ssl is not None:
+                stream = await stream.start_tls(
+                    self._proxy_ssl,
+                    server_hostname=self._proxy_host,
+                )
+
+            connector = create_connector(
+                proxy_type=self._proxy_type,
+                username=self._username,  # type: ignore[arg-type]
+                password=self._password,  # type: ignore[arg-type]
+                rdns=self._rdns,  # type: ignore[arg-type]
+                resolver=_create_resolver(),
+            )
+            await connector.connect(
+                stream=_SocksStream(stream),  # type: ignore[arg-type]
+                host=dest_host,
+                port=dest_port,
+            )
+
+            if dest_ssl is not None:
+                stream = await stream.start_tls(dest_ssl, server_hostname=dest_host)
+        except ReplyError as e:
+            with anyio.CancelScope(shield=True):
+                await stream.aclose()
+            raise ProxyError(e, error_code=e.error_code) from e
+        except BaseException:
+            with anyio.CancelScope(shield=True):
+                await stream.aclose()
+            raise
+
+        return stream
+
+    async def _connect_tcp(self) -> AsyncNetworkStream:
+        backend = sniffio.current_async_library()
+
+        try:
+            if backend == "asyncio":
+                return await _connect_tcp_asyncio(
+                    self._proxy_host,
+                    self._proxy_port,
+                    self._socket_options,
+                )
+            if backend == "trio":
+                return await _connect_tcp_trio(
+                    self._proxy_host,
+                    self._proxy_port,
+                    self._socket_options,
+                )
+        except OSError as e:
+            raise ProxyConnectionError(
+                e.errno,
+                f"Could not connect to proxy "
+                f"{self._proxy_host}:{self._proxy_port} [{e.strerror}]",
+            ) from e
+
+        raise RuntimeError(
+            f"Unsupported concurrency backend {backend!r}"
+        )  # pragma: no cover
+
+
+def _create_resolver() -> Any:
+    if sniffio.current_async_library() == "trio":
+        from python_socks.async_.trio._resolver import Resolver as TrioResolver
+
+        return TrioResolver()
+
+    from python_socks.async_.anyio._resolver import Resolver as AnyioResolver
+
+    return AnyioResolver()
+
+
+async def _connect_tcp_asyncio(
+    host: str,
+    port: int,
+    socket_options: Iterable[SOCKET_OPTION] | None,
+) -> AsyncNetworkStream:
+    from anyio.abc import SocketStream
+    from httpcore._backends.anyio import AnyIOStream
+
+    loop = asyncio.get_running_loop()
+    infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+
+    error: OSError = OSError("getaddrinfo returned an empty list")
+    for family, type_, proto, _, address in infos:
+        sock = socket.socket(family, type_, proto)
+        try:
+            sock.setblocking(False)  # noqa: FBT003
+            set_socket_options(sock, socket_options)
+            await loop.sock_connect(sock, address)
+        except OSError as e:
+            sock.close()
+            error = e
+        except BaseException:
+            sock.close()
+            raise
+        else:
+            return AnyIOStream(await SocketStream.from_socket(sock))
+
+    raise error
+
+
+async def _connect_tcp_trio(
+    host: str,
+    port: int,
+    socket_options: Iterable[SOCKET_OPTION] | None,
+) -> AsyncNetworkStream:
+    import trio
+    from httpcore._backends.trio import TrioStream
+
+    infos = await trio.socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+
+    error: OSError = OSError("getaddrinfo returned an empty list")
+    for family, type_, proto, _, address in infos:
+        sock = trio.socket.socket(family, type_, proto)
+        try:
+            set_socket_options(sock, socket_options)
+            await sock.connect(address)
+        except OSError as e:
+            sock.close()
+            error = e
+        except BaseException:
+            sock.close()
+            raise
+        else:
+            return TrioStream(trio.SocketStream(sock))
+
+    raise error
@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 import ssl
+from collections.abc import Iterable
 from typing import Any
 
-import sniffio
 from httpcore import (
     AsyncConnectionInterface,
     AsyncConnectionPool,
@@ -16,9 +16,12 @@ from httpcore import (
     Response,
     default_ssl_context,
 )
+from httpcore._backends.base import SOCKET_OPTION
 from httpcore._synchronization import AsyncLock
 from python_socks import ProxyType, parse_proxy_url
 
+from ._async_connector import AsyncProxyConnector
+
 
 class AsyncProxy(AsyncConnectionPool):
     def __init__(
@@ -57,6 +60,7 @@ class AsyncProxy(AsyncConnectionPool):
             keepalive_expiry=self._keepalive_expiry,
             http1=self._http1,
             http2=self._http2,
+            socket_options=self._socket_options,
         )
 
     @classmethod
@@ -88,6 +92,7 @@ class AsyncProxyConnection(AsyncConnectionInterface):
         keepalive_expiry: float | None = None,
         http1: bool = True,
         http2: bool = False,
+        socket_options: Iterable[SOCKET_OPTION] | None = None,
     ) -> None:
 
         if ssl_context is None:  # pragma: no cover
@@ -106,6 +111,7 @@ class AsyncProxyConnection(AsyncConnectionInterface):
         self._keepalive_expiry = keepalive_expiry
         self._http1 = http1
         self._http2 = http2
+        self._socket_options = socket_options
 
         self._connect_lock = AsyncLock()
         self._connection: AsyncConnectionInterface | None = None
@@ -166,90 +172,24 @@ class AsyncProxyConnection(AsyncConnectionInterface):
         ssl_context = self._ssl_context if scheme == b"https" else None
         host = hostname.decode("ascii")  # ?
 
-        return await self._open_stream(
-            host=host,
-            port=port,
-            connect_timeout=connect_timeout,
-            ssl_context=ssl_context,
-        )
-
-    async def _open_stream(
-        self,
-        host: str,
-        port: int,
-        connect_timeout: float | None,
-        ssl_context: ssl.SSLContext | None,
-    ) -> AsyncNetworkStream:
-        backend = sniffio.current_async_library()
-
-        if backend == "asyncio":
-            return await self._open_aio_stream(host, port, connect_timeout, ssl_context)
-
-        if backend == "trio":
-            return await self._open_trio_stream(host, port, connect_timeout, ssl_context)
-
-        raise RuntimeError(
-            f"Unsupported concurrency backend {backend!r}"
-        )  # pragma: no cover
-
-    async def _open_aio_stream(
-        self,
-        host: str,
-        port: int,
-        connect_timeout: float | None,
-        ssl_context: ssl.SSLContext | None,
-    ) -> AsyncNetworkStream:
-        from httpcore._backends.anyio import AnyIOStream
-        from python_socks.async_.anyio.v2 import Proxy
-
-        proxy = Proxy.create(
-            proxy_type=self._proxy_type,
-            host=self._proxy_host,
-            port=self._proxy_port,
-            username=self._username,
-            password=self._password,
-            rdns=self._rdns,
-            proxy_ssl=self._proxy_ssl,
-        )
-
-        proxy_stream = await proxy.connect(
-            host,
-            port,
-            dest_ssl=ssl_context,
-            timeout=connect_timeout,
-        )
-
-        return AnyIOStream(proxy_stream.anyio_stream)
-
-    async def _open_trio_stream(
-        self,
-        host: str,
-        port: int,
-        connect_timeout: float | None,
-        ssl_context: ssl.SSLContext | None,
-    ) -> AsyncNetworkStream:
-        from httpcore._backends.trio import TrioStream
-        from python_socks.async_.trio.v2 import Proxy
-
-        proxy = Proxy.create(
+        connector = AsyncProxyConnector(
             proxy_type=self._proxy_type,
-            host=self._proxy_host,
-            port=self._proxy_port,
+            proxy_host=self._proxy_host,
+            proxy_port=self._proxy_port,
             username=self._username,
             password=self._password,
             rdns=self._rdns,
             proxy_ssl=self._proxy_ssl,
+            socket_options=self._socket_options,
         )
 
-        proxy_stream = await proxy.connect(
+        return await connector.connect(
             host,
             port,
             dest_ssl=ssl_context,
             timeout=connect_timeout,
         )
 
-        return TrioStream(proxy_stream.trio_stream)
-
     async def aclose(self) -> None:
         if self._connection is not None:
             await self._connection.aclose()
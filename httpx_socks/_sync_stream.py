@@ -1,39 +1,77 @@
+import select
+import socket
 import ssl
+import sys
 import typing
 
 from httpcore._backends.sync import SyncStream as CoreSyncStream
-from httpcore._utils import is_socket_readable
 from python_socks.sync.v2._ssl_transport import SSLTransport
 
+_USE_POLL = sys.platform != "win32" and getattr(select, "poll", None) is not None
+
 
 class SyncStream(CoreSyncStream):
-    def get_extra_info(self, info: str) -> typing.Any:  # noqa: C901, PLR0911, PLR0912
-        if info == "ssl_object":
-            if isinstance(self._sock, ssl.SSLSocket):
-                return self._sock._sslobj  # type: ignore[attr-defined]  # noqa: SLF001
-            if isinstance(self._sock, SSLTransport):
-                return self._sock.sslobj
+    def __init__(self, sock: socket.socket) -> None:
+        super().__init__(sock)
+
+        # Resolve the underlying transport objects once, so that
+        # get_extra_info doesn't have to re-inspect the socket type on every call
+        self._ssl_socket: ssl.SSLSocket | None = None
+        if isinstance(sock, SSLTransport):
+            self._raw_sock: socket.socket = sock.socket
+            self._ssl_object: typing.Any = sock.sslobj
+        else:
+            if isinstance(sock, ssl.SSLSocket):
+                # SSLSocket drops its _sslobj on close/unwrap, so it is read per call
+                self._ssl_socket = sock
+            self._raw_sock = sock
+            self._ssl_object = None
+
+        self._poll: typing.Any = None
+
+    def get_extra_info(self, info: str) -> typing.Any:
+        getter = self._extra_info_getters.get(info)
+        if getter is None:  # pragma: nocover
             return None
+        return getter(self)
+
+    def _is_readable(self) -> bool:
+        # Same semantics as httpcore._utils.is_socket_readable,
+        # but the poll object is created once per stream and reused
+        sock_fd = self._raw_sock.fileno()
+        if sock_fd < 0:  # pragma: nocover
+            return True
+
+        if not _USE_POLL:  # pragma: nocover
+            rready, _, _ = select.select([sock_fd], [], [], 0)
+            return bool(rready)
+
+        if self._poll is None:
+            self._poll = select.poll()
+            self._poll.register(sock_fd, select.POLLIN)
+
+        return bool(self._poll.poll(0))
 
-        if info == "client_addr":  # pragma: nocover
-            if isinstance(self._sock, SSLTransport):
-                return self._sock.socket.getsockname()
-            else:  # noqa: RET505
-                return self._sock.getsockname()
+    def _get_ssl_object(self) -> typing.Any:
+        if self._ssl_socket is not None:
+            return self._ssl_socket._sslobj  # type: ignore[attr-defined]  # noqa: SLF001
+        return self._ssl_object
 
-        if info == "server_addr":  # pragma: nocover
-            if isinstance(self._sock, SSLTransport):
-                return self._sock.socket.getpeername()
-            else:  # noqa: RET505
-                return self._sock.getpeername()
+    def _get_client_addr(self) -> typing.Any:  # pragma: nocover
+        return self._raw_sock.getsockname()
 
-        if info == "socket":  # pragma: nocover
-            return self._sock  # ???
+    def _get_server_addr(self) -> typing.Any:  # pragma: nocover
+        return self._raw_sock.getpeername()
 
-        if info == "is_readable":
-            if isinstance(self._sock, SSLTransport):
-                return is_socket_readable(self._sock.socket)
-            else:  # noqa: RET505
-                return is_socket_readable(self._sock)
+    def _get_socket(self) -> typing.Any:  # pragma: nocover
+        return self._sock  # ???
 
-        return None  # pragma: nocover
+    _extra_info_getters: typing.ClassVar[
+        dict[str, typing.Callable[["SyncStream"], typing.Any]]
+    ] = {
+        "ssl_object": _get_ssl_object,
+        "client_addr": _get_client_addr,
+        "server_addr": _get_server_addr,
+        "socket": _get_socket,
+        "is_readable": _is_readable,
+    }
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import socket
+from collections.abc import Iterable
+from typing import Any
+
+from httpcore import ConnectError
+from httpcore._backends.base import SOCKET_OPTION
+from httpcore._exceptions import map_exceptions
+
+
+def set_socket_options(
+    sock: socket.socket | Any,
+    socket_options: Iterable[SOCKET_OPTION] | None,
+) -> None:
+    if socket_options is None:
+        return
+
+    with map_exceptions({OSError: ConnectError}):
+        for option in socket_options:
+            sock.setsockopt(*option)
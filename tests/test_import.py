@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+_TRANSPORT_MODULES = ("httpx_socks._async_transport", "httpx_socks._sync_transport")
+
+
+def _loaded_modules(code: str) -> set[str]:
+    code = f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"
+    out = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return set(out.stdout.split())
+
+
+def test_import_is_lazy() -> None:
+    modules = _loaded_modules("import httpx_socks")
+    assert not modules.intersection(_TRANSPORT_MODULES)
+    assert "httpx" not in modules
+
+
+@pytest.mark.parametrize(
+    ("name", "module", "other"),
+    (
+        ("AsyncProxyTransport", *_TRANSPORT_MODULES),
+        ("SyncProxyTransport", *reversed(_TRANSPORT_MODULES)),
+    ),
+)
+def test_transport_loaded_on_first_access(name: str, module: str, other: str) -> None:
+    modules = _loaded_modules(f"from httpx_socks import {name}")
+    assert module in modules
+    assert other not in modules
+
+
+def test_unknown_attribute() -> None:
+    import httpx_socks
+
+    with pytest.raises(AttributeError):
+        httpx_socks.NoSuchTransport  # type: ignore[attr-defined]  # noqa: B018
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import socket
 import ssl
 from unittest import mock
 
@@ -234,3 +235,34 @@ def test_failed_proxy_connection() -> None:
                 client.get(url=url)
 
         assert len(client._transport._pool._connections) == 0  # type: ignore[attr-defined] # noqa: SLF001
+
+
+def test_sync_stream_extra_info() -> None:
+    from httpx_socks._sync_stream import SyncStream
+
+    a, b = socket.socketpair()
+    with a, b:
+        stream = SyncStream(a)
+        assert stream.get_extra_info("ssl_object") is None
+        assert stream.get_extra_info("is_readable") is False
+        b.sendall(b"x")
+        assert stream.get_extra_info("is_readable") is True
+        assert stream.read(1) == b"x"
+        assert stream.get_extra_info("is_readable") is False
+
+
+def test_sync_stream_ssl_object_follows_socket() -> None:
+    from httpx_socks._sync_stream import SyncStream
+
+    a, b = socket.socketpair()
+    with b:
+        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        ssl_sock = ssl_context.wrap_socket(
+            a,
+            server_hostname="localhost",
+            do_handshake_on_connect=False,
+        )
+        stream = SyncStream(ssl_sock)
+        assert stream.get_extra_info("ssl_object") is not None
+        ssl_sock.close()
+        assert stream.get_extra_info("ssl_object") is None